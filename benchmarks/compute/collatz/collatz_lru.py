@@ -0,0 +1,31 @@
+# Collatz Conjecture Benchmark (lru_cache variant)
+# Count total steps for all numbers 1 to N
+#
+# Zero-effort memoization baseline: the step counter becomes recursive so
+# @lru_cache (C-implemented in CPython) memoizes trajectory tails. Pure
+# stdlib — a sanity reference point below the Numba/DP variants.
+
+import sys
+from functools import lru_cache
+
+# Deepest trajectory for n <= 1e6 is 524 steps; leave headroom above the
+# default 1000 for the surrounding frames.
+sys.setrecursionlimit(2000)
+
+@lru_cache(maxsize=None)
+def collatz_steps(n: int) -> int:
+    if n == 1:
+        return 0
+    return 1 + collatz_steps(n >> 1 if n % 2 == 0 else 3 * n + 1)
+
+def main():
+    limit = 1_000_000
+    total_steps = 0
+
+    for n in range(1, limit + 1):
+        total_steps += collatz_steps(n)
+
+    print(f"Total Collatz steps for 1..{limit}: {total_steps}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+# Collatz Conjecture Benchmark (memoized variant)
+# Bottom-up DP over a shared step-count table, compiled with Numba.
+#
+# Trajectories merge heavily (every even n falls straight into n/2), so the
+# baseline recomputes the same tails over and over. Here each trajectory is
+# walked only until it lands on a value whose count is already known, then the
+# in-range values visited along the way are back-filled. Total work drops from
+# O(sum of trajectory lengths) to O(limit) amortized, for 4*limit bytes of
+# table (int32).
+
+import numpy as np
+from numba import njit
+
+# Longest trajectory for n <= 1e6 is 524 steps, so a fixed back-fill stack
+# comfortably covers every in-range value seen on one walk.
+MAX_PATH = 2048
+
+@njit(cache=True)
+def total_steps(limit: int) -> int:
+    steps = np.full(limit + 1, -1, dtype=np.int32)
+    steps[1] = 0
+    path_val = np.empty(MAX_PATH, dtype=np.int64)
+    path_hop = np.empty(MAX_PATH, dtype=np.int64)
+
+    total = 0
+    for n in range(1, limit + 1):
+        num = n
+        hops = 0
+        depth = 0
+        # Walk until we land on a value whose count is already known.
+        while num > limit or steps[num] < 0:
+            if num <= limit:
+                path_val[depth] = num
+                path_hop[depth] = hops
+                depth += 1
+            if num & 1 == 0:
+                num = num >> 1
+            else:
+                num = 3 * num + 1
+            hops += 1
+        # Back-fill the in-range values visited on the way down.
+        base = steps[num]
+        for i in range(depth):
+            steps[path_val[i]] = base + (hops - path_hop[i])
+        total += steps[n]
+    return total
+
+def main():
+    limit = 1_000_000
+    print(f"Total Collatz steps for 1..{limit}: {total_steps(limit)}")
+
+if __name__ == "__main__":
+    main()
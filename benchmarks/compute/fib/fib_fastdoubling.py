@@ -0,0 +1,34 @@
+# Fibonacci Benchmark (fast-doubling variant)
+# Compute fib(N) mod 10^9+7 in O(log N) multiplications
+#
+# Uses the fast-doubling identities
+#   F(2k)   = F(k) * (2*F(k+1) - F(k))
+#   F(2k+1) = F(k)^2 + F(k+1)^2
+# so fib(1,000,000) takes ~20 modular multiplies instead of 1,000,000 adds.
+# The baseline fib.py stays O(N) so the cross-language comparison keeps
+# measuring the same algorithm; this variant shows the algorithmic headroom.
+
+def fib_pair(n: int, modulo: int) -> tuple[int, int]:
+    """Return (F(n), F(n+1)) mod modulo via fast doubling."""
+    if n == 0:
+        return (0, 1)
+
+    a, b = fib_pair(n >> 1, modulo)
+    c = (a * ((2 * b - a) % modulo)) % modulo
+    d = (a * a + b * b) % modulo
+
+    if n & 1 == 0:
+        return (c, d)
+    return (d, (c + d) % modulo)
+
+def fib_mod(n: int, modulo: int) -> int:
+    return fib_pair(n, modulo)[0]
+
+def main():
+    n = 1_000_000
+    modulo = 1_000_000_007
+    result = fib_mod(n, modulo)
+    print(f"fib({n}) mod {modulo} = {result}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,24 @@
+# GCD Benchmark (NumPy variant)
+# Same deterministic pairs as gcd.py, computed as one vectorized ufunc call.
+#
+# Both argument arrays come from a single arange, so the 10M math.gcd calls
+# (each paying CPython dispatch) collapse into one C-level np.gcd loop over
+# contiguous int64 buffers. The two pair buffers cost ~160 MB; chunk the
+# arange if that ever matters.
+
+import numpy as np
+
+
+def main():
+    iterations = 10_000_000
+
+    i = np.arange(1, iterations + 1, dtype=np.int64)
+    a = (i * 17) % 10000 + 1
+    b = (i * 31) % 10000 + 1
+    total = int(np.gcd(a, b).sum())
+
+    print(f"Sum of {iterations} GCDs: {total}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,44 @@
+# Mandelbrot Benchmark (Numba variant)
+# Calculate escape iterations for Mandelbrot set
+#
+# Unlike the vectorized NumPy kernel, this keeps the scalar early-exit per
+# pixel (no wasted passes over escaped points) and spreads rows across cores
+# with prange. The per-pixel loop is the same as mandelbrot.py, compiled to
+# native code.
+
+from numba import njit, prange
+
+@njit(parallel=True, fastmath=True, cache=True)
+def mandelbrot_total(size: int, max_iter: int) -> int:
+    total = 0
+    for y in prange(size):
+        row = 0
+        for x in range(size):
+            cr = 2.0 * x / size - 1.5
+            ci = 2.0 * y / size - 1.0
+            zr = 0.0
+            zi = 0.0
+            escaped = False
+            for i in range(max_iter):
+                zr2 = zr * zr
+                zi2 = zi * zi
+                if zr2 + zi2 > 4.0:
+                    row += i
+                    escaped = True
+                    break
+                zi = 2.0 * zr * zi + ci
+                zr = zr2 - zi2 + cr
+            if not escaped:
+                row += max_iter
+        total += row
+    return total
+
+def main():
+    size = 2000
+    max_iter = 50
+    total_iter = mandelbrot_total(size, max_iter)
+
+    print(f"Total iterations: {total_iter}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,54 @@
+# Mandelbrot Benchmark (NumPy variant)
+# Calculate escape iterations for Mandelbrot set
+#
+# Vectorized in cache-sized bands rather than over the full grid: each band
+# of rows keeps its iteration state (z, c, indices) small enough to stay hot
+# in cache across all 50 passes, instead of streaming a 2000x2000 complex
+# buffer from DRAM every pass. Escaped points are also compacted out each
+# iteration, so the arrays shrink as the band converges.
+
+import numpy as np
+
+BAND_ROWS = 32  # iteration state per band stays around a couple of MB
+
+def mandelbrot_band(c: np.ndarray, max_iter: int, iters: np.ndarray) -> None:
+    """Fill `iters` with escape counts for the flat complex band `c`."""
+    z = np.zeros_like(c)
+    idx = np.arange(c.size)
+
+    for _ in range(max_iter):
+        alive = (z.real * z.real + z.imag * z.imag) <= 4.0
+        if not alive.any():
+            break
+        # Compact: drop escaped points so later passes touch less data.
+        z = z[alive]
+        c = c[alive]
+        idx = idx[alive]
+        iters[idx] += 1
+        z = z * z + c
+
+def mandelbrot_grid(size: int, max_iter: int) -> int:
+    total = 0
+    x = np.arange(size)
+    cr = 2.0 * x / size - 1.5
+
+    for ystart in range(0, size, BAND_ROWS):
+        ys = np.arange(ystart, min(ystart + BAND_ROWS, size))
+        ci = 2.0 * ys / size - 1.0
+        c = (cr[np.newaxis, :] + 1j * ci[:, np.newaxis]).ravel()
+
+        iters = np.zeros(c.size, dtype=np.int32)
+        mandelbrot_band(c, max_iter, iters)
+        total += int(iters.sum())
+
+    return total
+
+def main():
+    size = 2000
+    max_iter = 50
+    total_iter = mandelbrot_grid(size, max_iter)
+
+    print(f"Total iterations: {total_iter}")
+
+if __name__ == "__main__":
+    main()
@@ -11,23 +11,44 @@ def make_body(x, y, z, vx, vy, vz, mass):
     return [x, y, z, vx, vy, vz, mass]
 
 def advance(bodies, dt, steps):
+    # Hot loop: hoist len(), math.sqrt and body i's fields into locals.
+    # Each bodies[i][k] is two subscript dispatches that CPython repeats
+    # 12+ times per pair otherwise; body i's position and mass are loop
+    # invariants for the whole j-loop, and its velocity is only touched by
+    # its own updates, so it can be accumulated locally and written back
+    # once per row.
+    sqrt = math.sqrt
+    n = len(bodies)
     for _ in range(steps):
         # Update velocities
-        for i in range(len(bodies)):
-            for j in range(i + 1, len(bodies)):
-                dx = bodies[i][0] - bodies[j][0]
-                dy = bodies[i][1] - bodies[j][1]
-                dz = bodies[i][2] - bodies[j][2]
+        for i in range(n):
+            bi = bodies[i]
+            xi = bi[0]
+            yi = bi[1]
+            zi = bi[2]
+            vxi = bi[3]
+            vyi = bi[4]
+            vzi = bi[5]
+            mi = bi[6]
+            for j in range(i + 1, n):
+                bj = bodies[j]
+                dx = xi - bj[0]
+                dy = yi - bj[1]
+                dz = zi - bj[2]
                 dist_sq = dx * dx + dy * dy + dz * dz
-                dist = math.sqrt(dist_sq)
+                dist = sqrt(dist_sq)
                 mag = dt / (dist_sq * dist)
 
-                bodies[i][3] -= dx * bodies[j][6] * mag
-                bodies[i][4] -= dy * bodies[j][6] * mag
-                bodies[i][5] -= dz * bodies[j][6] * mag
-                bodies[j][3] += dx * bodies[i][6] * mag
-                bodies[j][4] += dy * bodies[i][6] * mag
-                bodies[j][5] += dz * bodies[i][6] * mag
+                mj = bj[6]
+                vxi -= dx * mj * mag
+                vyi -= dy * mj * mag
+                vzi -= dz * mj * mag
+                bj[3] += dx * mi * mag
+                bj[4] += dy * mi * mag
+                bj[5] += dz * mi * mag
+            bi[3] = vxi
+            bi[4] = vyi
+            bi[5] = vzi
 
         # Update positions
         for body in bodies:
@@ -0,0 +1,145 @@
+# N-Body Benchmark (array.array SoA variant)
+# Planetary orbit simulation (from Benchmarks Game)
+#
+# Middle ground between the boxed list-of-lists baseline and the NumPy SoA
+# rewrite: the seven fields live in stdlib array('d') buffers, so storage is
+# contiguous C doubles with no third-party dependency. CPython still boxes
+# each element on read, but nothing boxed is retained, and PyPy's JIT
+# specializes array('d') access far more aggressively than list access.
+
+import math
+from array import array
+
+PI = math.pi
+SOLAR_MASS = 4 * PI * PI
+DAYS_PER_YEAR = 365.24
+
+def make_bodies():
+    """Return the system as seven parallel array('d')s: x, y, z, vx, vy, vz, m."""
+    rows = [
+        # Sun
+        [0.0, 0.0, 0.0, 0.0, 0.0, 0.0, SOLAR_MASS],
+        # Jupiter
+        [
+            4.84143144246472090,
+            -1.16032004402742839,
+            -0.103622044471123109,
+            0.00166007664274403694 * DAYS_PER_YEAR,
+            0.00769901118419740425 * DAYS_PER_YEAR,
+            -0.0000690460016972063023 * DAYS_PER_YEAR,
+            0.000954791938424326609 * SOLAR_MASS,
+        ],
+        # Saturn
+        [
+            8.34336671824457987,
+            4.12479856412430479,
+            -0.403523417114321381,
+            -0.00276742510726862411 * DAYS_PER_YEAR,
+            0.00499852801234917238 * DAYS_PER_YEAR,
+            0.0000230417297573763929 * DAYS_PER_YEAR,
+            0.000285885980666130812 * SOLAR_MASS,
+        ],
+        # Uranus
+        [
+            12.8943695621391310,
+            -15.1111514016986312,
+            -0.223307578892655734,
+            0.00296460137564761618 * DAYS_PER_YEAR,
+            0.00237847173959480950 * DAYS_PER_YEAR,
+            -0.0000296589568540237556 * DAYS_PER_YEAR,
+            0.0000436624404335156298 * SOLAR_MASS,
+        ],
+        # Neptune
+        [
+            15.3796971148509165,
+            -25.9193146099879641,
+            0.179258772950371181,
+            0.00268067772490389322 * DAYS_PER_YEAR,
+            0.00162824170038242295 * DAYS_PER_YEAR,
+            -0.0000951592254519715870 * DAYS_PER_YEAR,
+            0.0000515138902046611451 * SOLAR_MASS,
+        ],
+    ]
+    return tuple(array("d", (row[k] for row in rows)) for k in range(7))
+
+def advance(x, y, z, vx, vy, vz, m, dt, steps):
+    sqrt = math.sqrt
+    n = len(x)
+    for _ in range(steps):
+        # Update velocities
+        for i in range(n):
+            xi = x[i]
+            yi = y[i]
+            zi = z[i]
+            vxi = vx[i]
+            vyi = vy[i]
+            vzi = vz[i]
+            mi = m[i]
+            for j in range(i + 1, n):
+                dx = xi - x[j]
+                dy = yi - y[j]
+                dz = zi - z[j]
+                dist_sq = dx * dx + dy * dy + dz * dz
+                dist = sqrt(dist_sq)
+                mag = dt / (dist_sq * dist)
+
+                mj = m[j]
+                vxi -= dx * mj * mag
+                vyi -= dy * mj * mag
+                vzi -= dz * mj * mag
+                vx[j] += dx * mi * mag
+                vy[j] += dy * mi * mag
+                vz[j] += dz * mi * mag
+            vx[i] = vxi
+            vy[i] = vyi
+            vz[i] = vzi
+
+        # Update positions
+        for i in range(n):
+            x[i] += dt * vx[i]
+            y[i] += dt * vy[i]
+            z[i] += dt * vz[i]
+
+def energy(x, y, z, vx, vy, vz, m):
+    e = 0.0
+    n = len(x)
+
+    for i in range(n):
+        # Kinetic energy
+        e += 0.5 * m[i] * (vx[i] * vx[i] + vy[i] * vy[i] + vz[i] * vz[i])
+
+        # Potential energy
+        for j in range(i + 1, n):
+            dx = x[i] - x[j]
+            dy = y[i] - y[j]
+            dz = z[i] - z[j]
+            dist = math.sqrt(dx * dx + dy * dy + dz * dz)
+            e -= (m[i] * m[j]) / dist
+
+    return e
+
+def offset_momentum(x, y, z, vx, vy, vz, m):
+    px = py = pz = 0.0
+
+    n = len(x)
+    for i in range(n):
+        px += vx[i] * m[i]
+        py += vy[i] * m[i]
+        pz += vz[i] * m[i]
+
+    vx[0] = -px / SOLAR_MASS
+    vy[0] = -py / SOLAR_MASS
+    vz[0] = -pz / SOLAR_MASS
+
+def main():
+    bodies = make_bodies()
+
+    offset_momentum(*bodies)
+
+    n = 500_000
+    advance(*bodies, 0.01, n)
+
+    print(f"Final energy: {energy(*bodies):.9f}")
+
+if __name__ == "__main__":
+    main()
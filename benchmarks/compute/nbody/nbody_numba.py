@@ -0,0 +1,72 @@
+# N-Body Benchmark (Numba variant)
+# Planetary orbit simulation (from Benchmarks Game)
+#
+# Compiles the SoA kernels from nbody_numpy.py with @njit. With fixed-type
+# float64 arrays the pair loop (10 pairs x 500k steps) compiles to native
+# code; fastmath allows reassociation and sqrt/div fusions. Compilation is
+# cached so repeat runs skip the JIT warmup.
+
+import math
+
+from numba import njit
+
+from nbody_numpy import make_bodies, offset_momentum
+
+@njit(cache=True, fastmath=True)
+def advance(x, y, z, vx, vy, vz, m, dt, steps):
+    n = x.shape[0]
+    for _ in range(steps):
+        # Update velocities
+        for i in range(n):
+            for j in range(i + 1, n):
+                dx = x[i] - x[j]
+                dy = y[i] - y[j]
+                dz = z[i] - z[j]
+                dist_sq = dx * dx + dy * dy + dz * dz
+                dist = math.sqrt(dist_sq)
+                mag = dt / (dist_sq * dist)
+
+                vx[i] -= dx * m[j] * mag
+                vy[i] -= dy * m[j] * mag
+                vz[i] -= dz * m[j] * mag
+                vx[j] += dx * m[i] * mag
+                vy[j] += dy * m[i] * mag
+                vz[j] += dz * m[i] * mag
+
+        # Update positions
+        for i in range(n):
+            x[i] += dt * vx[i]
+            y[i] += dt * vy[i]
+            z[i] += dt * vz[i]
+
+@njit(cache=True, fastmath=True)
+def energy(x, y, z, vx, vy, vz, m):
+    e = 0.0
+    n = x.shape[0]
+
+    for i in range(n):
+        # Kinetic energy
+        e += 0.5 * m[i] * (vx[i] * vx[i] + vy[i] * vy[i] + vz[i] * vz[i])
+
+        # Potential energy
+        for j in range(i + 1, n):
+            dx = x[i] - x[j]
+            dy = y[i] - y[j]
+            dz = z[i] - z[j]
+            dist = math.sqrt(dx * dx + dy * dy + dz * dz)
+            e -= (m[i] * m[j]) / dist
+
+    return e
+
+def main():
+    bodies = make_bodies()
+
+    offset_momentum(*bodies)
+
+    n = 500_000
+    advance(*bodies, 0.01, n)
+
+    print(f"Final energy: {energy(*bodies):.9f}")
+
+if __name__ == "__main__":
+    main()
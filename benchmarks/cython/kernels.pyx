@@ -0,0 +1,92 @@
+# cython: language_level=3
+# Cython AOT kernels for the Incan benchmark suite.
+#
+# Ahead-of-time compiled versions of the three hottest pure-Python loops
+# (Collatz step counting, the prime sieve marking loop, and the Mandelbrot
+# escape iteration). Unlike the Numba variants these pay no per-run JIT
+# warmup: build once with setup.py and import `kernels` from plain CPython.
+
+cimport cython
+from libc.stdlib cimport free, malloc
+from libc.string cimport memset
+
+
+cpdef long collatz_steps(long n):
+    """Count Collatz steps from n down to 1 (typed, native i64 loop)."""
+    cdef long count = 0
+    cdef long num = n
+    while num != 1:
+        if num & 1 == 0:
+            num = num >> 1
+        else:
+            num = 3 * num + 1
+        count += 1
+    return count
+
+
+cpdef long collatz_total(long limit):
+    """Total Collatz steps for 1..limit."""
+    cdef long total = 0
+    cdef long n
+    for n in range(1, limit + 1):
+        total += collatz_steps(n)
+    return total
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef long sieve_count(long limit):
+    """Sieve of Eratosthenes: count primes up to limit (1 byte per cell)."""
+    cdef char *is_prime = <char *> malloc(limit + 1)
+    if is_prime == NULL:
+        raise MemoryError()
+    cdef long p, multiple, count
+    try:
+        memset(is_prime, 1, limit + 1)
+        is_prime[0] = 0
+        if limit >= 1:
+            is_prime[1] = 0
+
+        p = 2
+        while p * p <= limit:
+            if is_prime[p]:
+                multiple = p * p
+                while multiple <= limit:
+                    is_prime[multiple] = 0
+                    multiple += p
+            p += 1
+
+        count = 0
+        for p in range(limit + 1):
+            count += is_prime[p]
+        return count
+    finally:
+        free(is_prime)
+
+
+cpdef int mandelbrot_escape(double cr, double ci, int max_iter):
+    """Escape iteration count for one Mandelbrot point."""
+    cdef double zr = 0.0
+    cdef double zi = 0.0
+    cdef double zr2, zi2
+    cdef int i
+    for i in range(max_iter):
+        zr2 = zr * zr
+        zi2 = zi * zi
+        if zr2 + zi2 > 4.0:
+            return i
+        zi = 2.0 * zr * zi + ci
+        zr = zr2 - zi2 + cr
+    return max_iter
+
+
+cpdef long mandelbrot_total(int size, int max_iter):
+    """Total escape iterations over the size x size benchmark grid."""
+    cdef long total = 0
+    cdef int x, y
+    for y in range(size):
+        for x in range(size):
+            total += mandelbrot_escape(
+                2.0 * x / size - 1.5, 2.0 * y / size - 1.0, max_iter
+            )
+    return total
@@ -0,0 +1,20 @@
+# Driver for the Cython AOT kernels, using the same workloads as the
+# corresponding baseline benchmarks (collatz.py, primes.py, mandelbrot.py).
+#
+# Build first:  python3 setup.py build_ext --inplace
+
+import kernels
+
+def main():
+    limit = 1_000_000
+    print(f"Total Collatz steps for 1..{limit}: {kernels.collatz_total(limit)}")
+
+    limit = 50_000_000
+    print(f"Primes up to {limit}: {kernels.sieve_count(limit)}")
+
+    size = 2000
+    max_iter = 50
+    print(f"Total iterations: {kernels.mandelbrot_total(size, max_iter)}")
+
+if __name__ == "__main__":
+    main()
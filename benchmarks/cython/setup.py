@@ -0,0 +1,17 @@
+from Cython.Build import cythonize
+from setuptools import Extension, setup
+
+extensions = [
+    Extension(
+        "kernels",
+        ["kernels.pyx"],
+        # Autovectorization + FMA where the host supports it; fast-math is
+        # safe here (the Mandelbrot kernel only compares magnitudes).
+        extra_compile_args=["-O3", "-march=native", "-ffast-math"],
+    )
+]
+
+setup(
+    name="incan-bench-kernels",
+    ext_modules=cythonize(extensions, language_level=3),
+)
@@ -1,39 +1,56 @@
 # Mergesort Benchmark
 # Sort 1,000,000 random integers (with allocation)
 
-import sys
-
-sys.setrecursionlimit(50000)  # Increase for deep recursion
-
 def mergesort(arr: list) -> list:
     n = len(arr)
     if n <= 1:
         return arr
 
-    mid = n // 2
-    left = mergesort(arr[:mid])
-    right = mergesort(arr[mid:])
+    # Sort by mutating `arr` in place over index ranges, with a single scratch
+    # buffer allocated once and reused for every merge. This avoids the
+    # O(N log N) slice allocations of the classic `arr[:mid]` / `arr[mid:]`
+    # formulation and mirrors mergesort.incn.
+    temp = [0] * n
+    mergesort_range(arr, temp, 0, n)
+    return arr
 
-    return merge(left, right)
+def mergesort_range(arr: list, temp: list, lo: int, hi: int):
+    # Sorts arr[lo:hi) in place; recursion depth is only log2(N).
+    if hi - lo <= 1:
+        return
 
-def merge(left: list, right: list) -> list:
-    result = []
-    i = 0
-    j = 0
+    mid = (lo + hi) // 2
+    mergesort_range(arr, temp, lo, mid)
+    mergesort_range(arr, temp, mid, hi)
+    merge_range(arr, temp, lo, mid, hi)
 
-    while i < len(left) and j < len(right):
-        if left[i] <= right[j]:
-            result.append(left[i])
+def merge_range(arr: list, temp: list, lo: int, mid: int, hi: int):
+    # Merge arr[lo:mid) and arr[mid:hi) into temp[lo:hi), then copy back.
+    i = lo
+    j = mid
+    k = lo
+
+    while i < mid and j < hi:
+        if arr[i] <= arr[j]:
+            temp[k] = arr[i]
             i += 1
         else:
-            result.append(right[j])
+            temp[k] = arr[j]
             j += 1
+        k += 1
+
+    # Copy remaining elements
+    while i < mid:
+        temp[k] = arr[i]
+        i += 1
+        k += 1
 
-    # Append remaining elements
-    result.extend(left[i:])
-    result.extend(right[j:])
+    while j < hi:
+        temp[k] = arr[j]
+        j += 1
+        k += 1
 
-    return result
+    arr[lo:hi] = temp[lo:hi]
 
 def generate_random_array(size: int, seed: int) -> list:
     arr = []
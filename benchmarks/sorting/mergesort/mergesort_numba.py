@@ -0,0 +1,77 @@
+# Mergesort Benchmark (Numba variant)
+# Sort 1,000,000 random integers in an np.int64 array
+#
+# Same index-based in-place mergesort as mergesort.py, but storage is a
+# typed int64 array and generation, recursion and merging all run under
+# @njit with a Numba-allocated scratch buffer.
+
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def mergesort(arr):
+    n = arr.shape[0]
+    if n <= 1:
+        return arr
+
+    temp = np.empty_like(arr)
+    mergesort_range(arr, temp, 0, n)
+    return arr
+
+@njit(cache=True)
+def mergesort_range(arr, temp, lo, hi):
+    if hi - lo <= 1:
+        return
+
+    mid = (lo + hi) // 2
+    mergesort_range(arr, temp, lo, mid)
+    mergesort_range(arr, temp, mid, hi)
+    merge_range(arr, temp, lo, mid, hi)
+
+@njit(cache=True)
+def merge_range(arr, temp, lo, mid, hi):
+    i = lo
+    j = mid
+    k = lo
+
+    while i < mid and j < hi:
+        if arr[i] <= arr[j]:
+            temp[k] = arr[i]
+            i += 1
+        else:
+            temp[k] = arr[j]
+            j += 1
+        k += 1
+
+    while i < mid:
+        temp[k] = arr[i]
+        i += 1
+        k += 1
+
+    while j < hi:
+        temp[k] = arr[j]
+        j += 1
+        k += 1
+
+    for idx in range(lo, hi):
+        arr[idx] = temp[idx]
+
+@njit(cache=True)
+def generate_random_array(size, seed):
+    # Same LCG as the baseline, filling a typed array.
+    arr = np.empty(size, dtype=np.int64)
+    state = seed
+    for i in range(size):
+        state = (state * 1103515245 + 12345) % 2147483648
+        arr[i] = state % 1000000
+    return arr
+
+def main():
+    size = 1_000_000
+    arr = generate_random_array(size, 42)
+    sorted_arr = mergesort(arr)
+    print(f"Sorted {size} elements")
+    print(f"First 5: {sorted_arr[0]}, {sorted_arr[1]}, {sorted_arr[2]}, {sorted_arr[3]}, {sorted_arr[4]}")
+
+if __name__ == "__main__":
+    main()
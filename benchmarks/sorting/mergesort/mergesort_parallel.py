@@ -0,0 +1,68 @@
+# Mergesort Benchmark (multiprocessing variant)
+# Sort 1,000,000 random integers across worker processes
+#
+# Exploits mergesort's divide-and-conquer structure: the array is split into
+# one contiguous chunk per core, each worker sorts its chunk with the
+# sequential mergesort from mergesort.py, and the parent merges the sorted
+# chunks pairwise. Speedup is sub-linear because the final merges are serial
+# and each chunk is pickled across the process boundary.
+
+import os
+from multiprocessing import Pool
+
+from mergesort import generate_random_array, mergesort
+
+def merge_pair(left: list, right: list) -> list:
+    result = []
+    i = 0
+    j = 0
+    nl = len(left)
+    nr = len(right)
+
+    while i < nl and j < nr:
+        if left[i] <= right[j]:
+            result.append(left[i])
+            i += 1
+        else:
+            result.append(right[j])
+            j += 1
+
+    while i < nl:
+        result.append(left[i])
+        i += 1
+
+    while j < nr:
+        result.append(right[j])
+        j += 1
+
+    return result
+
+def parallel_mergesort(arr: list, workers: int | None = None) -> list:
+    workers = workers or os.cpu_count() or 1
+    if workers <= 1 or len(arr) < 2 * workers:
+        return mergesort(arr)
+
+    # One contiguous chunk per worker.
+    chunk = (len(arr) + workers - 1) // workers
+    parts = [arr[i:i + chunk] for i in range(0, len(arr), chunk)]
+
+    with Pool(workers) as pool:
+        parts = pool.map(mergesort, parts)
+
+    # Merge sorted chunks pairwise in the parent.
+    while len(parts) > 1:
+        parts = [
+            merge_pair(parts[i], parts[i + 1]) if i + 1 < len(parts) else parts[i]
+            for i in range(0, len(parts), 2)
+        ]
+    return parts[0]
+
+def main():
+    size = 1_000_000
+    arr = generate_random_array(size, 42)
+    sorted_arr = parallel_mergesort(arr)
+    print(f"Sorted {size} elements")
+    print(f"First 5: {sorted_arr[0]}, {sorted_arr[1]}, {sorted_arr[2]}, {sorted_arr[3]}, {sorted_arr[4]}")
+
+if __name__ == "__main__":
+    main()
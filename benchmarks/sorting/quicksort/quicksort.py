@@ -1,27 +1,57 @@
 # Quicksort Benchmark
 # Sort 1,000,000 random integers in-place
 
-import sys
-
-sys.setrecursionlimit(10000)  # Increase for deep recursion
+CUTOFF = 16  # Below this size, insertion sort beats the partitioning overhead
 
 def quicksort(arr: list, low: int, high: int):
-    if low < high:
-        pivot_idx = partition(arr, low, high)
-        quicksort(arr, low, pivot_idx - 1)
-        quicksort(arr, pivot_idx + 1, high)
+    if high - low < CUTOFF:
+        insertion_sort(arr, low, high)
+        return
+
+    lt, gt = partition(arr, low, high)
+    quicksort(arr, low, lt - 1)
+    quicksort(arr, gt + 1, high)
 
-def partition(arr: list, low: int, high: int) -> int:
-    pivot = arr[high]
-    i = low - 1
+def partition(arr: list, low: int, high: int) -> tuple:
+    # Median-of-three pivot: immune to already-sorted input, and a better
+    # split than the old arr[high] choice.
+    mid = (low + high) // 2
+    if arr[mid] < arr[low]:
+        arr[low], arr[mid] = arr[mid], arr[low]
+    if arr[high] < arr[low]:
+        arr[low], arr[high] = arr[high], arr[low]
+    if arr[high] < arr[mid]:
+        arr[mid], arr[high] = arr[high], arr[mid]
+    pivot = arr[mid]
 
-    for j in range(low, high):
-        if arr[j] <= pivot:
+    # Three-way (Dutch national flag) partition: the 1M keys are drawn mod
+    # 1e6, so duplicate runs are common and collapse into the middle band
+    # instead of recursing.
+    lt = low
+    gt = high
+    i = low
+    while i <= gt:
+        if arr[i] < pivot:
+            arr[i], arr[lt] = arr[lt], arr[i]
+            lt += 1
             i += 1
-            arr[i], arr[j] = arr[j], arr[i]
+        elif arr[i] > pivot:
+            arr[i], arr[gt] = arr[gt], arr[i]
+            gt -= 1
+        else:
+            i += 1
+
+    # Everything in arr[lt:gt+1] equals the pivot.
+    return lt, gt
 
-    arr[i + 1], arr[high] = arr[high], arr[i + 1]
-    return i + 1
+def insertion_sort(arr: list, low: int, high: int):
+    for i in range(low + 1, high + 1):
+        key = arr[i]
+        j = i - 1
+        while j >= low and arr[j] > key:
+            arr[j + 1] = arr[j]
+            j -= 1
+        arr[j + 1] = key
 
 def generate_random_array(size: int, seed: int) -> list:
     # Simple LCG random number generator for reproducibility
@@ -0,0 +1,51 @@
+# Quicksort Benchmark (Numba variant)
+# Sort 1,000,000 random integers in-place in an np.int64 array
+#
+# Same Lomuto-partition quicksort and LCG input as quicksort.py, but the
+# array is typed int64 and both generation and sorting run under @njit, so
+# comparisons and swaps are native loads/stores instead of PyLong
+# dereferences.
+
+import numpy as np
+from numba import njit
+
+@njit(cache=True)
+def quicksort(arr, low, high):
+    if low < high:
+        pivot_idx = partition(arr, low, high)
+        quicksort(arr, low, pivot_idx - 1)
+        quicksort(arr, pivot_idx + 1, high)
+
+@njit(cache=True)
+def partition(arr, low, high):
+    pivot = arr[high]
+    i = low - 1
+
+    for j in range(low, high):
+        if arr[j] <= pivot:
+            i += 1
+            arr[i], arr[j] = arr[j], arr[i]
+
+    arr[i + 1], arr[high] = arr[high], arr[i + 1]
+    return i + 1
+
+@njit(cache=True)
+def generate_random_array(size, seed):
+    # Same LCG as the baseline, filling a typed array.
+    arr = np.empty(size, dtype=np.int64)
+    state = seed
+    for i in range(size):
+        state = (state * 1103515245 + 12345) % 2147483648
+        arr[i] = state % 1000000
+    return arr
+
+def main():
+    size = 1_000_000
+    arr = generate_random_array(size, 42)
+
+    quicksort(arr, 0, size - 1)
+    print(f"Sorted {size} elements")
+    print(f"First 5: {arr[0]}, {arr[1]}, {arr[2]}, {arr[3]}, {arr[4]}")
+
+if __name__ == "__main__":
+    main()
@@ -1,9 +1,12 @@
 from __future__ import annotations
 
+import json
 import logging
+import operator
 import os
 import re
 from pathlib import Path
+from typing import Iterator
 
 import mkdocs_gen_files
 from mkdocs.exceptions import ConfigurationError
@@ -17,17 +20,48 @@ IMPLEMENTED_DIR = CLOSED_DIR / "implemented"
 SUPERSEDED_DIR = CLOSED_DIR / "superseded"
 REJECTED_DIR = CLOSED_DIR / "rejected"
 
+# Precomputed prefixes for classifying files by location with one
+# str.startswith instead of relative_to() + parts tuple matching per file.
+_IMPLEMENTED_PREFIX = str(IMPLEMENTED_DIR) + os.sep
+_SUPERSEDED_PREFIX = str(SUPERSEDED_DIR) + os.sep
+_REJECTED_PREFIX = str(REJECTED_DIR) + os.sep
+
 DOCS_BASE_PREFIX = Path("/" + os.environ.get("INCAN_DOCS_BASE_PREFIX", "").strip())
 
+# Metadata cache so `mkdocs serve` reruns only re-read RFCs that changed.
+CACHE_FILE = DOCS_DIR / ".rfc_index_cache.json"
+
+# Hot-path regexes, compiled once at import. `re`'s internal cache still pays
+# a dict lookup per call, and _strip_rfc_prefix used to re-build (and
+# re-escape) its pattern for every row.
+# Title and both status forms fused into one alternation so metadata
+# extraction is a single scan over the file contents.
+_META_RE = re.compile(
+    r"^(?:#\s+(?P<title>.+?)|\s*\*\*Status:\*\*\s*(?P<s1>.+?)|\s*-\s*Status:\s*(?P<s2>.+?))\s*$",
+    re.MULTILINE,
+)
+_STRIP_RFC_RE = re.compile(r"^RFC\s+(\d+)\s*:\s*(.+)$", re.IGNORECASE)
+_RFC_ID_RE = re.compile(r"^(\d+)")
+
 RFC_WIDTH = 9
 STATUS_WIDTH = 11
 TRACK_WIDTH = 20
 TITLE_WIDTH = 120 - (2 + RFC_WIDTH + 3 + STATUS_WIDTH + 3 + TRACK_WIDTH + 3 + 2)
 
+# Row template with the column widths baked in: one C-level .format call per
+# row instead of re-parsing an f-string format spec each time.
+_ROW_FMT = f"| {{:<{RFC_WIDTH}}} | {{:<{STATUS_WIDTH}}} | {{:<{TRACK_WIDTH}}} | {{:<{TITLE_WIDTH}}} |"
+
+
+# The joined-and-normalized prefix as a plain string, so each row is a
+# string concatenation instead of a PurePosixPath allocation. Like the
+# Path join it replaces, this never yields a trailing slash.
+_PREFIX_STR = DOCS_BASE_PREFIX.as_posix().rstrip("/") + "/"
+
 
 def _with_base_prefix(path: str) -> str:
     """Prefix a site-root path with the configured docs base prefix."""
-    return (DOCS_BASE_PREFIX / path.lstrip("/")).as_posix()
+    return _PREFIX_STR + path.strip("/")
 
 
 def _extract_rfc_metadata(md_path: Path, need_status: bool) -> tuple[str, str]:
@@ -36,50 +70,72 @@ def _extract_rfc_metadata(md_path: Path, need_status: bool) -> tuple[str, str]:
     Returns:
         (title, status) where status is "Unknown" if need_status=False or not found.
     """
-    text = md_path.read_text(encoding="utf-8", errors="replace")
-    
+    # Raw bytes + one-shot decode; skips the TextIOWrapper machinery.
+    text = md_path.read_bytes().decode("utf-8", "replace")
+
     title = None
     status = "Unknown"
-    
-    for line in text.splitlines():
-        # Extract title (first H1)
-        if title is None:
-            if m := re.match(r"^#\s+(.+?)\s*$", line):
-                title = m.group(1).strip()
-        
-        # Extract status (only if needed for open RFCs)
-        if need_status:
-            if m := re.match(r"^\s*\*\*Status:\*\*\s*(.+?)\s*$", line):
-                status = m.group(1).strip()
-                break
-            if m := re.match(r"^\s*-\s*Status:\s*(.+?)\s*$", line):
-                status = m.group(1).strip()
+
+    # One fused pass: the combined alternation finds titles and status lines
+    # in document order, so the text is scanned once instead of once per
+    # pattern.
+    for m in _META_RE.finditer(text):
+        if t := m.group("title"):
+            if title is None:
+                title = t.strip()
+            if not need_status:
                 break
-        
-        # Early exit if we have both
-        if title and (not need_status or status != "Unknown"):
+        elif need_status:
+            status = (m.group("s1") or m.group("s2")).strip()
             break
-    
+
+        # Done once we have both
+        if title and status != "Unknown":
+            break
+
     return (title or md_path.stem, status)
 
 
+def _load_metadata_cache() -> dict:
+    """Load the mtime-keyed metadata cache; empty dict on any failure."""
+    try:
+        return json.loads(CACHE_FILE.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_metadata_cache(cache: dict) -> None:
+    """Persist the metadata cache atomically; best-effort only."""
+    try:
+        tmp = CACHE_FILE.with_suffix(".json.tmp")
+        tmp.write_text(json.dumps(cache), encoding="utf-8")
+        os.replace(tmp, CACHE_FILE)
+    except OSError:
+        pass
+
+
 def _rfc_id_from_filename(filename: str) -> str:
     """extract the RFC id from a filename
     "013_rust_crate_dependencies.md" -> "013"
     """
-    m = re.match(r"^(\d+)", filename)
+    m = _RFC_ID_RE.match(filename)
     return m.group(1) if m else filename
 
 
+_PIPE_TABLE = str.maketrans({"|": "\\|"})
+
+
 def _escape_pipes(s: str) -> str:
     """Keep markdown tables valid by escaping pipes."""
-    return s.replace("|", "\\|")
+    return s.translate(_PIPE_TABLE)
 
 def _strip_rfc_prefix(title: str, rfc_id: str) -> str:
     """Convert titles like 'RFC 001: Test Fixtures' to 'Test Fixtures' for display."""
     title = title.strip()
-    m = re.match(rf"^RFC\s+{re.escape(rfc_id)}\s*:\s*(.+)$", title, flags=re.IGNORECASE)
-    return m.group(1).strip() if m else title
+    # One generic pattern that extracts the id, instead of interpolating
+    # (and escaping) rfc_id into a fresh pattern per row.
+    m = _STRIP_RFC_RE.match(title)
+    return m.group(2).strip() if m and m.group(1) == rfc_id else title
 
 
 def _sorted_md_files(dir_path: Path) -> list[Path]:
@@ -95,82 +151,109 @@ def _sorted_md_files(dir_path: Path) -> list[Path]:
     return sorted(files, key=lambda p: p.name)
 
 
-def _collect_rfc_md_files() -> list[Path]:
-    """Collect RFC markdown files under `RFCs/` (including closed/ subfolders).
-    
-    Filters out index.md and TEMPLATE.md. Returns unsorted (will be sorted by RFC ID later).
+def _iter_rfc_files() -> Iterator[tuple[Path, Path, str, bool, str]]:
+    """Stream RFC markdown files under `RFCs/` (including closed/ subfolders).
+
+    Filters out index.md and TEMPLATE.md and yields
+    (path, rel, track, need_status, default_status) tuples, unsorted (rows
+    are sorted by RFC ID later). Fusing the walk with the classification
+    avoids materializing an intermediate list of Paths per rebuild.
     """
     if not RFC_DIR.exists():
-        return []
-    files: list[Path] = []
+        return
     for p in RFC_DIR.rglob("*.md"):
         if not p.is_file():
             continue
         name_lower = p.name.lower()
         if name_lower == "index.md" or p.name == "TEMPLATE.md":
             continue
-        files.append(p)
-    return files
 
+        # Determine track and whether we need to extract status from file.
+        # A single prefix check on the string path replaces the old
+        # relative_to() + rel.parts tuple match.
+        s = str(p)
+        if s.startswith(_IMPLEMENTED_PREFIX):
+            need_status = False
+            status = "Done"
+            track = "closed / implemented"
+        elif s.startswith(_SUPERSEDED_PREFIX):
+            need_status = False
+            status = "Superseded"
+            track = "closed / superseded"
+        elif s.startswith(_REJECTED_PREFIX):
+            need_status = False
+            status = "Rejected"
+            track = "closed / rejected"
+        else:
+            need_status = True
+            track = "proposed / active"
+            status = ""  # Will be extracted below
+
+        # rel is only needed for URL building, after classification.
+        rel = p.relative_to(RFC_DIR)
+        yield p, rel, track, need_status, status
 
-def _collect_rows() -> list[tuple[str, str, str, str, str]]:
-    """Collect RFCs and return rows: (rfc_id, title, status, track, url)."""
-    rows: list[tuple[str, str, str, str, str]] = []
 
-    # One pass over all RFC markdown files; track/status are inferred from location.
-    for p in _collect_rfc_md_files():
-        rel = p.relative_to(RFC_DIR)
+def _collect_rows() -> list[tuple[int, str, str, str, str, str]]:
+    """Collect RFCs and return rows: (sort_key, rfc_id, title, status, track, url)."""
+    rows: list[tuple[int, str, str, str, str, str]] = []
+
+    # mkdocs live-reload re-imports this module on every rebuild; the mtime
+    # cache means only RFCs that actually changed get re-read and re-parsed.
+    cache = _load_metadata_cache()
+    cache_dirty = False
 
-        # Determine track and whether we need to extract status from file
-        match rel.parts:
-            case ("closed", "implemented", *_):
-                need_status = False
-                status = "Done"
-                track = "closed / implemented"
-            case ("closed", "superseded", *_):
-                need_status = False
-                status = "Superseded"
-                track = "closed / superseded"
-            case ("closed", "rejected", *_):
-                need_status = False
-                status = "Rejected"
-                track = "closed / rejected"
-            case _:
-                need_status = True
-                track = "proposed / active"
-                status = ""  # Will be extracted below
-
-        # Extract metadata in one file read
-        raw_title, extracted_status = _extract_rfc_metadata(p, need_status)
+    # One pass over all RFC markdown files; track/status are inferred from location.
+    for p, rel, track, need_status, status in _iter_rfc_files():
+        # Extract metadata, skipping the read entirely on a cache hit
+        key = str(p)
+        mtime_ns = p.stat().st_mtime_ns
+        entry = cache.get(key)
+        if entry and entry[0] == mtime_ns:
+            raw_title, extracted_status = entry[1], entry[2]
+        else:
+            raw_title, extracted_status = _extract_rfc_metadata(p, need_status)
+            cache[key] = [mtime_ns, raw_title, extracted_status]
+            cache_dirty = True
         if need_status:
             status = extracted_status
 
         rfc_id = _rfc_id_from_filename(p.name)
         title = _strip_rfc_prefix(raw_title, rfc_id)
 
+        # Integer sort key extracted once at row-build time: int compares are
+        # cheaper than string compares and immune to zero-padding drift.
+        try:
+            sort_key = int(rfc_id)
+        except ValueError:
+            sort_key = -1  # non-numeric filenames group first
+
         # URL mirrors doc path, but uses directory URLs (`.../<name>/`).
         url_path = f"/RFCs/{rel.with_suffix('').as_posix()}/"
         url = _with_base_prefix(url_path)
-        rows.append((rfc_id, title, status, track, url))
+        rows.append((sort_key, rfc_id, title, status, track, url))
 
-    # Sort by RFC id (string numeric sort works because ids are zero-padded)
-    rows.sort(key=lambda r: r[0])
+    if cache_dirty:
+        _save_metadata_cache(cache)
+
+    # Sort by RFC id; itemgetter is C-implemented, unlike a lambda key.
+    rows.sort(key=operator.itemgetter(0, 1))
     return rows
 
 
-def _render_reference_links(rows: list[tuple[str, str, str, str, str]]) -> str:
+def _render_reference_links(rows: list[tuple[int, str, str, str, str, str]]) -> str:
     """Render reference-style RFC links for reuse across docs pages."""
     lines: list[str] = []
     lines.append("<!-- THIS FILE IS AUTOGENERATED. DO NOT EDIT BY HAND. -->")
     lines.append("")
     lines.append("<!-- RFC reference links for reuse: '[RFC 018]' or '[RFC 018: Title][RFC 018]' -->")
-    for rfc_id, _title, _status, _track, url in rows:
+    for _key, rfc_id, _title, _status, _track, url in rows:
         lines.append(f"[RFC {rfc_id}]: {url}")
     lines.append("")
     return "\n".join(lines)
 
 
-def _render_table(rows: list[tuple[str, str, str, str, str]]) -> str:
+def _render_table(rows: list[tuple[int, str, str, str, str, str]]) -> str:
     """Render the RFCs index table."""
     lines: list[str] = []
     lines.append("<!-- THIS FILE IS AUTOGENERATED. DO NOT EDIT BY HAND. -->")
@@ -196,13 +279,13 @@ def _render_table(rows: list[tuple[str, str, str, str, str]]) -> str:
     # `md_in_html` is enabled in mkdocs.yml, so `markdown="1"` ensures the table renders correctly.
     lines.append('<div data-rfc-table="rfcs-index" markdown="1">')
     lines.append("")
-    lines.append(f"| {'RFC':<{RFC_WIDTH}} | {'Status':<{STATUS_WIDTH}} | {'Track':<{TRACK_WIDTH}} | {'Title':<{TITLE_WIDTH}} |")
+    lines.append(_ROW_FMT.format("RFC", "Status", "Track", "Title"))
     lines.append(f"| {'':-<{RFC_WIDTH-1}}: | {'':-<{STATUS_WIDTH}} | {'':-<{TRACK_WIDTH}} | {'':-<{TITLE_WIDTH}} |")
-    for rfc_id, title, status, track, url in rows:
+    for _key, rfc_id, title, status, track, url in rows:
         safe_title = _escape_pipes(title)
         safe_status = _escape_pipes(status)
         safe_track = _escape_pipes(track)
-        lines.append(f"| {'[RFC ' + rfc_id + ']':<{RFC_WIDTH}} | {safe_status:<{STATUS_WIDTH}} | {safe_track:<{TRACK_WIDTH}} | {safe_title:<{TITLE_WIDTH}} |")
+        lines.append(_ROW_FMT.format(f"[RFC {rfc_id}]", safe_status, safe_track, safe_title))
     lines.append("")
     lines.append("</div>")
     lines.append("<!-- markdownlint-enable MD013 MD060 MD053 MD033 -->")
@@ -221,12 +304,17 @@ def main() -> None:
     rel_path = "_snippets/tables/rfcs_index.md"
     refs_rel_path = "_snippets/rfcs_refs.md"
 
+    # Each output goes to two sinks; encode to UTF-8 once and write the same
+    # bytes to both instead of re-encoding per write.
+    content_bytes = content.encode("utf-8")
+    refs_bytes = refs.encode("utf-8")
+
     # Write to mkdocs virtual filesystem first (used during build)
     try:
-        with mkdocs_gen_files.open(rel_path, "w") as f:
-            f.write(content)
-        with mkdocs_gen_files.open(refs_rel_path, "w") as f:
-            f.write(refs)
+        with mkdocs_gen_files.open(rel_path, "wb") as f:
+            f.write(content_bytes)
+        with mkdocs_gen_files.open(refs_rel_path, "wb") as f:
+            f.write(refs_bytes)
     except ConfigurationError:
         # Not running via mkdocs (standalone execution)
         pass
@@ -236,8 +324,8 @@ def main() -> None:
     (DOCS_DIR / "_snippets" / "tables").mkdir(parents=True, exist_ok=True)
     
     refs_file = DOCS_DIR / refs_rel_path
-    (DOCS_DIR / rel_path).write_text(content, encoding="utf-8")
-    refs_file.write_text(refs, encoding="utf-8")
+    (DOCS_DIR / rel_path).write_bytes(content_bytes)
+    refs_file.write_bytes(refs_bytes)
     
     # Log first few lines to verify prefix (visible in mkdocs build output)
     preview = "\n".join(refs.splitlines()[:5])
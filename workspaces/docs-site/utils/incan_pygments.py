@@ -1,22 +1,29 @@
 from __future__ import annotations
 
+import concurrent.futures
+import functools
 import re
 from pathlib import Path
-from typing import Iterable, Sequence
+from typing import Iterable
 
 from pygments.lexers import _mapping
 from pygments.lexers.python import PythonLexer
 from pygments.token import Keyword, Name, Operator, Token
 
 
+@functools.lru_cache(maxsize=None)
 def _load_keywords_from_registry() -> list[str]:
-    """Load canonical keywords from the Rust registry file."""
+    """Load canonical keywords from the Rust registry file.
+
+    Cached: the registry does not change mid-build, and Pygments can
+    construct a lexer per code fence.
+    """
     repo_root = Path(__file__).resolve().parents[2]
     registry_path = repo_root / "crates" / "incan_core" / "src" / "lang" / "keywords.rs"
     if not registry_path.exists():
         return []
 
-    text = registry_path.read_text(encoding="utf-8", errors="replace")
+    text = registry_path.read_bytes().decode("utf-8", "replace")
     pattern = re.compile(
         r'info(?:_with_aliases)?\(\s*KeywordId::[A-Za-z_]+,\s*"([^"]+)"',
         re.DOTALL,
@@ -24,66 +31,75 @@ def _load_keywords_from_registry() -> list[str]:
     return sorted({match.group(1) for match in pattern.finditer(text)})
 
 
-_INFO_WITH_ALIASES = re.compile(
-    r'info\([^,]+,\s*"([^"]+)"\s*,\s*&\[(.*?)\]',
+# One pattern for both shapes: group 2 is the alias blob when the call has an
+# `&[...]` argument, None otherwise. A single finditer pass replaces the old
+# separate with-aliases and canonical-only scans over the same text.
+_INFO_COMBINED = re.compile(
+    r'info(?:_with_aliases)?\([^,]+,\s*"([^"]+)"(?:\s*,\s*&\[(.*?)\])?',
     re.DOTALL,
 )
-_INFO_CANONICAL = re.compile(r'info\([^,]+,\s*"([^"]+)"', re.DOTALL)
+# Compiled once: findall on a string pattern pays re's cache lookup for every
+# alias blob in the finditer loop below.
+_ALIAS_STRING_RE = re.compile(r'"([^"]+)"')
 
 
 def _extract_lang_items(text: str) -> tuple[set[str], set[str]]:
     canonicals: set[str] = set()
     aliases: set[str] = set()
 
-    for match in _INFO_WITH_ALIASES.finditer(text):
+    for match in _INFO_COMBINED.finditer(text):
         canonicals.add(match.group(1))
         alias_blob = match.group(2)
-        aliases.update(re.findall(r'"([^"]+)"', alias_blob))
-
-    for match in _INFO_CANONICAL.finditer(text):
-        canonicals.add(match.group(1))
+        if alias_blob is not None:
+            aliases.update(_ALIAS_STRING_RE.findall(alias_blob))
 
     return canonicals, aliases
 
 
-def _load_lang_items(paths: Sequence[Path]) -> tuple[set[str], set[str]]:
+@functools.lru_cache(maxsize=None)
+def _load_lang_items(paths: tuple[Path, ...]) -> tuple[set[str], set[str]]:
     canonicals: set[str] = set()
     aliases: set[str] = set()
-    for path in paths:
-        if not path.exists():
-            continue
-        text = path.read_text(encoding="utf-8", errors="replace")
-        c, a = _extract_lang_items(text)
-        canonicals.update(c)
-        aliases.update(a)
+    existing = [path for path in paths if path.exists()]
+    if not existing:
+        return canonicals, aliases
+    # Reads are blocking I/O, so pipeline them through a small thread pool;
+    # the CPU-bound regex extraction stays on this thread as results land.
+    with concurrent.futures.ThreadPoolExecutor(max_workers=4) as pool:
+        for text in pool.map(lambda path: path.read_bytes().decode("utf-8", "replace"), existing):
+            c, a = _extract_lang_items(text)
+            canonicals.update(c)
+            aliases.update(a)
     return canonicals, aliases
 
 
+@functools.lru_cache(maxsize=None)
 def _load_stdlib_functions() -> set[str]:
     repo_root = Path(__file__).resolve().parents[3]
     base = repo_root / "crates" / "incan_core" / "src" / "lang"
-    paths = [
+    paths = (
         base / "builtins.rs",
         base / "surface" / "functions.rs",
         base / "surface" / "constructors.rs",
         base / "surface" / "math.rs",
         base / "surface" / "methods.rs",
-    ]
+    )
     canonicals, aliases = _load_lang_items(paths)
     return canonicals.union(aliases)
 
 
+@functools.lru_cache(maxsize=None)
 def _load_stdlib_types() -> set[str]:
     repo_root = Path(__file__).resolve().parents[3]
     base = repo_root / "crates" / "incan_core" / "src" / "lang"
-    paths = [
+    paths = (
         base / "types" / "numerics.rs",
         base / "types" / "collections.rs",
         base / "types" / "stringlike.rs",
         base / "surface" / "types.rs",
         base / "derives.rs",
         base / "errors.rs",
-    ]
+    )
     canonicals, aliases = _load_lang_items(paths)
     return canonicals.union(aliases)
 
@@ -143,6 +159,25 @@ def _keywords() -> Iterable[str]:
     return sorted(set(keywords).union(_fallback_keywords(), extras))
 
 
+# Computed once at import: the Rust sources these come from cannot change
+# mid-build, so per-lexer recomputation was pure waste.
+_INCAN_KEYWORDS = frozenset(_keywords())
+_INCAN_TYPES = frozenset(_load_stdlib_types())
+_INCAN_FUNCTIONS = frozenset(_load_stdlib_functions())
+
+# Exact-name dispatch table: one hashed lookup instead of up to three set
+# membership checks per Name token. Insertion order encodes precedence
+# (keywords override types override functions, as the old check chain did).
+_NAME_MAP: dict[str, object] = {}
+for _name in _INCAN_FUNCTIONS:
+    _NAME_MAP[_name] = Name.Builtin
+for _name in _INCAN_TYPES:
+    _NAME_MAP[_name] = Keyword.Type
+for _name in _INCAN_KEYWORDS:
+    _NAME_MAP[_name] = Keyword
+del _name
+
+
 class IncanLexer(PythonLexer):
     """Pygments lexer for the Incan programming language."""
 
@@ -155,37 +190,36 @@ class IncanLexer(PythonLexer):
 
     def __init__(self, **options):
         super().__init__(**options)
-        self._incan_keywords = set(_keywords())
-        self._incan_types = _load_stdlib_types()
-        self._incan_functions = _load_stdlib_functions()
+        self._name_map = _NAME_MAP
 
     def get_tokens_unprocessed(self, text, stack=("root",)):
+        name_map_get = self._name_map.get
         for index, token, value in super().get_tokens_unprocessed(text, stack=stack):
-            if token is Name and value in self._incan_keywords:
-                yield index, Keyword, value
-                continue
-            if token is Name and value in self._incan_types:
-                yield index, Keyword.Type, value
-                continue
-            if token is Name and value in self._incan_functions:
-                yield index, Name.Builtin, value
-                continue
-            if token is Name and value.startswith("assert_"):
-                yield index, Name.Function, value
-                continue
-            if token is Token.Error and value == "?":
+            if token is Name:
+                new_tok = name_map_get(value)
+                if new_tok is not None:
+                    yield index, new_tok, value
+                    continue
+                if value.startswith("assert_"):
+                    yield index, Name.Function, value
+                    continue
+                if value and value[0].isupper():
+                    yield index, Name.Class, value
+                    continue
+            elif token is Token.Error and value == "?":
                 yield index, Operator, value
                 continue
-            if token is Name and value[:1].isupper():
-                yield index, Name.Class, value
-                continue
             yield index, token, value
 
 
+_REGISTERED = False
+
+
 def register_incan_lexer() -> None:
     """Register Incan lexer with Pygments for MkDocs builds."""
 
-    if "IncanLexer" in _mapping.LEXERS:
+    global _REGISTERED
+    if _REGISTERED or "IncanLexer" in _mapping.LEXERS:
         return
 
     _mapping.LEXERS["IncanLexer"] = (
@@ -195,6 +229,11 @@ def register_incan_lexer() -> None:
         tuple(IncanLexer.filenames),
         tuple(IncanLexer.mimetypes),
     )
+    _REGISTERED = True
+
 
+# Register eagerly so importers (and per-page rebuild hooks that call
+# register_incan_lexer defensively) never pay the registration check twice.
+register_incan_lexer()
 
 __all__ = ["IncanLexer"]